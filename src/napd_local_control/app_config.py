@@ -41,6 +41,12 @@ class NapdLocalControlConfig(config.Schema):
         self.pressure_sensor_app = config.Application("Pressure Sensor App", description="A pressure sensor application")
             
         self.tank_level_app = config.Application("Tank Level App", description="The tank level application")
+        
+        self.latch_faults = config.Boolean(
+            "Latch Faults",
+            default=True,
+            description="Keep pump faults active until cleared with the selector button. If disabled, faults clear once the pumps leave the fault state"
+        )
 
     @property
     def start_pump_edge_rising(self):
@@ -1,10 +1,10 @@
 import logging
 import time
 import asyncio
+from typing import Any, Optional
 
 from pydoover.docker import Application
 from pydoover import ui
-from pydoover.utils.kalman import apply_async_kalman_filter
 
 from .app_config import NapdLocalControlConfig, EdgeChoice
 from .dashboard import NAPDDashboard, DashboardInterface
@@ -20,9 +20,40 @@ except ImportError:
 
 log = logging.getLogger()
 
+# Potentiometer Kalman filter tuning. The initial error and outlier handling follow pydoover's KalmanFilter1D.
+POT_PROCESS_VARIANCE = 0.01
+POT_MEASUREMENT_VARIANCE = 0.0005
+POT_INITIAL_ERROR_RATIO = 25
+POT_OUTLIER_THRESHOLD = 5
+POT_OUTLIER_VARIANCE_MULTIPLIER = 25
+# Deadband floor in volts, so a pot resting at or near 0 V still has a band to sit in
+POT_MIN_DEADBAND = 0.01
+
+# The pot and pump states/LEDs are handled every main_loop tick; dashboard data only every Nth tick
+DASHBOARD_UPDATE_TICKS = 5  # 1 s at the 0.2 s loop period
+
+
+def _to_float(value: Any, default: Optional[float] = None) -> Optional[float]:
+    """Convert a tag value to a float, returning default if it is missing, not numeric or NaN."""
+    if value is None:
+        return default
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return default
+    return default if value != value else value
+
 class NapdLocalControlApplication(Application):
     config: NapdLocalControlConfig  # not necessary, but helps your IDE provide autocomplete!
 
+    # pump AppState -> state shown on the dashboard (anything else shows as "standby")
+    _DASHBOARD_PUMP_STATES = {"auto": "pumping"}
+    # pump AppState -> fault flag it trips
+    _FAULT_FLAGS = {
+        "pressure_high_high_level": "hh_pressure_active",
+        "tank_level_low_low_level": "ll_tank_level_active",
+    }
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -37,6 +68,31 @@ class NapdLocalControlApplication(Application):
         
         self.hh_pressure_active = False
         self.ll_tank_level_active = False
+        # (hh_pressure, ll_tank_level) last sent to the dashboard
+        self._faults_sent = None
+        
+        # Latest dashboard tag values keyed by (app_key, tag_key), kept current by tag subscriptions
+        self._dashboard_state: dict = {}
+        self._dashboard_subscribed = False
+        self._dirty = True
+        
+        # Last values written to the LED outputs, keyed by pin. This app is the only writer of those
+        # pins, so these shadow the platform state without reading it back every tick.
+        self._do_shadow: dict[int, bool] = {}
+        self._ao_shadow: dict[int, float] = {}
+        
+        # Potentiometer Kalman filter state: estimate, error estimate and time of the last update
+        self._kf_x: Optional[float] = None
+        self._kf_p: float = 0.0
+        self._kf_t: float = 0.0
+        # Last committed pot reading, replaced by the first real one in setup
+        self._set_last_ai_input(0.0)
+        
+        self._tick = 0
+
+    def get_tag_float(self, tag_key: str, app_key: str = None, default: Optional[float] = None) -> Optional[float]:
+        """Get a tag value as a float, or default if it is missing, not numeric or NaN."""
+        return _to_float(self.get_tag(tag_key, app_key), default)
 
     async def _retry_pulse_counter(self, func, *args, **kwargs):
         """Retry a pulse counter operation until it succeeds, handling DEADLINE_EXCEEDED errors."""
@@ -64,11 +120,45 @@ class NapdLocalControlApplication(Application):
                 log.error(f"Unexpected error creating pulse counter: {e}")
                 raise
 
+    def _cache_config(self):
+        """Resolve the config values used every tick once, instead of on each access."""
+        self._pump1_id = self.config.pump_1.value
+        self._pump2_id = self.config.pump_2.value
+        self._pump_ids = {1: self._pump1_id, 2: self._pump2_id}
+        # (start LED pin, fault LED pin) for each pump
+        self._pump_led_pins = {
+            1: (self.config.pump_1_start_LED_pin.value, self.config.pump_1_fault_LED_pin.value),
+            2: (self.config.pump_2_start_LED_pin.value, self.config.pump_2_fault_LED_pin.value),
+        }
+        # platform (DO, AO) tag keys for those pins
+        self._pump_led_tags = {
+            pump_number: (f"DO{pump_LED_pin}", f"AO{pump_fault_LED_pin}")
+            for pump_number, (pump_LED_pin, pump_fault_LED_pin) in self._pump_led_pins.items()
+        }
+        self._potentiometer_pin = self.config.potentiometer_pin.value
+        self._solar_app_ids = tuple(solar_controller.value for solar_controller in self.config.solar_controllers.elements)
+        self._tank_level_app_id = self.config.tank_level_app.value
+        self._pressure_sensor_app_id = self.config.pressure_sensor_app.value
+        self._latch_faults = self.config.latch_faults.value
+
+    async def _on_deployment_config_update(self, *args, **kwargs):
+        await super()._on_deployment_config_update(*args, **kwargs)
+        # config can be updated at runtime, so re-resolve the cached values
+        self._cache_config()
+        if self._dashboard_subscribed:
+            # the dashboard cache is keyed by app id, so follow any apps that were swapped out
+            self._dashboard_state.clear()
+            self._subscribe_dashboard_tags()
+
     async def setup(self):
         self.loop_target_period = 0.2
+        self._cache_config()
         
         # Start dashboard
         self.dashboard_interface.start_dashboard()
+        # Dashboard snapshots are handed to a worker so dashboard slowness can't stretch the control loop
+        self._dash_queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+        self._dash_worker_task = asyncio.create_task(self._dash_worker())
         
         ## create button and dial pulse counting subs
         
@@ -101,9 +191,16 @@ class NapdLocalControlApplication(Application):
             await asyncio.sleep(0.2)
         log.info("AO0 is ready")
         
+        # Seed the LED shadow registers from the current platform outputs
+        for pump_number, (pump_LED_pin, pump_fault_LED_pin) in self._pump_led_pins.items():
+            pump_LED_tag, pump_fault_LED_tag = self._pump_led_tags[pump_number]
+            self._do_shadow[pump_LED_pin] = bool(self.get_tag(pump_LED_tag, "platform"))
+            fault_led_state = self.get_tag(pump_fault_LED_tag, "platform")
+            self._ao_shadow[pump_fault_LED_pin] = float(fault_led_state) if fault_led_state is not None else 0.0
+        
         #init states
-        self.p1_app_state = self.get_tag("AppState", self.config.pump_1.value)
-        self.p2_app_state = self.get_tag("AppState", self.config.pump_2.value)
+        self.p1_app_state = self.get_tag("AppState", self._pump1_id)
+        self.p2_app_state = self.get_tag("AppState", self._pump2_id)
         if self.p1_app_state is None:
             self.p1_app_state = "off"
         if self.p2_app_state is None:
@@ -111,13 +208,16 @@ class NapdLocalControlApplication(Application):
         await self.pump_1_state_change_cb(None,self.p1_app_state)
         await self.pump_2_state_change_cb(None,self.p2_app_state)
         
+        self._subscribe_dashboard_tags()
+        
         # call_maybe_async(callback, tag_key, new_value
         
         # self.subscribe_to_tag("AppState",self.pump_1_state_change_cb,self.config.pump_1.value)
         # self.subscribe_to_tag("AppState",self.pump_2_state_change_cb,self.config.pump_2.value)
         
                 
-        self.last_ai_input = await self.platform_iface.get_ai(self.config.potentiometer_pin.value)
+        ai_input = await self.platform_iface.get_ai(self._potentiometer_pin)
+        self._set_last_ai_input(float(ai_input) if ai_input is not None else 0.0)
         
         log.info("Dashboard started on port 8092")
 
@@ -126,69 +226,82 @@ class NapdLocalControlApplication(Application):
         
         # self.get_tag("tank_level", self.config.tank_level_app.value)
         # a random value we set inside our simulator. Go check it out in simulators/sample!
-        # Update dashboard with example data
-        await self.update_target_rate()
-        await self.update_dashboard_data()
-        # await self.update_pump_leds()
+        self._tick += 1
+        # Independent of each other: fault detection feeds the LEDs inside update_pump_states,
+        # and the target rate and dashboard data don't read anything the others write.
+        steps = [self.update_target_rate(), self.update_pump_states()]
+        # a client that just started watching gets data from this tick rather than the next scheduled one
+        refresh = self.dashboard_interface.consume_refresh_request()
+        if refresh or self._tick % DASHBOARD_UPDATE_TICKS == 0:
+            steps.append(self.update_dashboard_data())
+        # Wait for every step even if one fails, so none is left running into the next tick
+        results = await asyncio.gather(*steps, return_exceptions=True)
+        failures = [(step, result) for step, result in zip(steps, results) if isinstance(result, Exception)]
+        if failures:
+            for step, error in failures[1:]:
+                log.error(f"Error in {step.__qualname__}: {error}", exc_info=error)
+            # raise the first so pydoover still marks the app unhealthy and restarts it
+            raise failures[0][1]
         
     async def pump_1_state_change_cb(self, app_key, new_value: str):
         await self.state_change_cb(new_value,1)
-        if self.p1_app_state == "auto":
-            self.dashboard_interface.update_pump_data(pump_state="pumping")
-        else:
-            self.dashboard_interface.update_pump_data(pump_state="standby")
+        self.dashboard_interface.update_pump_data(
+            pump_state=self._DASHBOARD_PUMP_STATES.get(self.p1_app_state, "standby")
+        )
         
         await self.update_pump1_leds()
         
     async def pump_2_state_change_cb(self, app_key, new_value: str):
         await self.state_change_cb(new_value, 2)
-        if self.p2_app_state == "auto":
-            self.dashboard_interface.update_pump2_data(pump_state="pumping")
-        else:
-            self.dashboard_interface.update_pump2_data(pump_state="standby")
+        self.dashboard_interface.update_pump2_data(
+            pump_state=self._DASHBOARD_PUMP_STATES.get(self.p2_app_state, "standby")
+        )
         await self.update_pump2_leds()
     async def state_change_cb(self, new_value: str, pump_number: int):
-        pump_app = getattr(self.config, f"pump_{pump_number}").value
-        if "pressure_high_high_level" == new_value:
-            if not self.hh_pressure_active:
-                self.hh_pressure_active = True
-                await self.set_tag("State", 0, pump_app)
-        elif "tank_level_low_low_level" == new_value:
-            if not self.ll_tank_level_active:
-                self.ll_tank_level_active = True
-                await self.set_tag("State", 0, pump_app)
+        fault_flag = self._FAULT_FLAGS.get(new_value)
+        if fault_flag is not None and not getattr(self, fault_flag):
+            setattr(self, fault_flag, True)
+            await self.set_tag("State", 0, self._pump_ids[pump_number])
         
+        self._publish_faults()
+    
+    def _publish_faults(self):
+        """Send the fault flags to the dashboard when they change."""
+        faults = (self.hh_pressure_active, self.ll_tank_level_active)
+        if faults == self._faults_sent:
+            return
+        self._faults_sent = faults
         self.dashboard_interface.set_faults(
             hh_pressure=self.hh_pressure_active,
             ll_tank_level=self.ll_tank_level_active
         )
         
     async def _update_pump_leds(self, pump_number: int):
-        # print("updating LEDS")
-        # print("self.ll_tank_level_active ",self.ll_tank_level_active)
-        # print("self.hh_pressure_active ",self.hh_pressure_active)
-        pump_LED_pin = getattr(self.config, f"pump_{pump_number}_start_LED_pin").value
-        pump_fault_LED_pin = getattr(self.config, f"pump_{pump_number}_fault_LED_pin").value
-        pmp_led_state = self.get_tag(f"DO{pump_LED_pin}", "platform")
-        fault_led_state = self.get_tag(f"AO{pump_fault_LED_pin}", "platform")
-        
+        pump_LED_pin, pump_fault_LED_pin = self._pump_led_pins[pump_number]
         app_state = getattr(self, f"p{pump_number}_app_state")
         
-        # print("pmp_led_state ",pmp_led_state)
-        # print("fault_led_state ",fault_led_state)
+        # The fault and start LEDs are separate channels, so any writes needed go out together
+        writes = []
+        
         # Update fault LED
-        if fault_led_state is not None:
-            if (self.hh_pressure_active or self.ll_tank_level_active):
-                if float(fault_led_state) < 0.1:
-                    await self.platform_iface.set_ao(pump_fault_LED_pin, 100)
-            elif fault_led_state > 0:
-                await self.platform_iface.set_ao(pump_fault_LED_pin, 0)
-        
-        if app_state  == "auto":
-            if not pmp_led_state:
-                await self.platform_iface.set_do(pump_LED_pin, True)
-        elif pmp_led_state:
-            await self.platform_iface.set_do(pump_LED_pin, False)
+        fault_led_level = 100 if (self.hh_pressure_active or self.ll_tank_level_active) else 0
+        if self._ao_shadow.get(pump_fault_LED_pin) != fault_led_level:
+            writes.append(self._set_led_ao(pump_fault_LED_pin, fault_led_level))
+        
+        pump_led_on = app_state == "auto"
+        if self._do_shadow.get(pump_LED_pin) != pump_led_on:
+            writes.append(self._set_led_do(pump_LED_pin, pump_led_on))
+        
+        if writes:
+            await asyncio.gather(*writes)
+    
+    async def _set_led_ao(self, pin: int, value: float):
+        await self.platform_iface.set_ao(pin, value)
+        self._ao_shadow[pin] = value
+    
+    async def _set_led_do(self, pin: int, value: bool):
+        await self.platform_iface.set_do(pin, value)
+        self._do_shadow[pin] = value
         
     async def update_pump1_leds(self):
         await self._update_pump_leds(1)
@@ -196,36 +309,67 @@ class NapdLocalControlApplication(Application):
         await self._update_pump_leds(2)
         
     async def update_target_rate(self):
+        raw_ai_input = await self.platform_iface.get_ai(self._potentiometer_pin)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Raw AI Input: {raw_ai_input}")
+        # Cheap deadband on the raw sample first, so the filter only runs once the pot has moved
+        if raw_ai_input is not None and self._last_ai_lo < raw_ai_input < self._last_ai_hi:
+            return
+        
         pump_number = self.dashboard_interface.getSelectedPump()
-        ai_input = await self.get_pot_reading(kf_measurement_variance=0.0005)
-        log.debug(f"AI Input: {ai_input}")
-        if ai_input is not None and self.last_ai_input * 0.99 < ai_input < self.last_ai_input * 1.01:
+        ai_input = self.get_pot_reading(raw_ai_input)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"AI Input: {ai_input}")
+        # No reading and no estimate yet (e.g. the first tick after startup), nothing to act on
+        if ai_input is None or self._last_ai_lo < ai_input < self._last_ai_hi:
             return
         
-        sys_voltage = self.get_tag("voltage", "platform")
+        sys_voltage = self.get_tag_float("voltage", "platform")
         if not sys_voltage:
             sys_voltage = 25.0
         target_rate = round(ai_input / sys_voltage * 100, 2)
         
-        if pump_number == 1:
-            await self.set_tag("TargetRatePercentage", target_rate, self.config.pump_1.value)
-        elif pump_number == 2:
-            await self.set_tag("TargetRatePercentage", target_rate, self.config.pump_2.value)
-        self.last_ai_input = ai_input
-        
-    @apply_async_kalman_filter(process_variance=.01)
-    async def get_pot_reading(self, kf_measurement_variance=1):
-        ai_input = await self.platform_iface.get_ai(self.config.potentiometer_pin.value)
-        log.debug(f"Raw AI Input: {ai_input}")
-        return ai_input
+        pump_app = self._pump_ids.get(pump_number)
+        if pump_app:
+            await self.set_tag("TargetRatePercentage", target_rate, pump_app)
+        self._set_last_ai_input(ai_input)
+    
+    def _set_last_ai_input(self, value: float):
+        """Commit a pot reading and precompute the 1% deadband around it, no narrower than POT_MIN_DEADBAND."""
+        self.last_ai_input = value
+        band = max(abs(value) * 0.01, POT_MIN_DEADBAND)
+        self._last_ai_lo = value - band
+        self._last_ai_hi = value + band
+        
+    def get_pot_reading(self, raw_ai_input: Optional[float], measurement_variance: float = POT_MEASUREMENT_VARIANCE) -> Optional[float]:
+        """Filter a raw potentiometer sample with a scalar Kalman filter and return the estimate."""
+        if raw_ai_input is None:
+            return self._kf_x
+        
+        now = time.monotonic()
+        if self._kf_x is None:
+            self._kf_x = raw_ai_input
+            self._kf_p = measurement_variance * POT_INITIAL_ERROR_RATIO
+            self._kf_t = now
+            return self._kf_x
+        
+        if abs(raw_ai_input - self._kf_x) > POT_OUTLIER_THRESHOLD * self._kf_p:
+            measurement_variance *= POT_OUTLIER_VARIANCE_MULTIPLIER
+        
+        # predict, scaling the process variance by the time since the last update, then correct
+        p = self._kf_p + POT_PROCESS_VARIANCE * (now - self._kf_t)
+        k = p / (p + measurement_variance)
+        self._kf_x += k * (raw_ai_input - self._kf_x)
+        self._kf_p = (1 - k) * p
+        self._kf_t = now
+        return self._kf_x
     
     async def selector_button_callback(self, di, di_value, dt_secs, counter, edge):
         if self.hh_pressure_active or self.ll_tank_level_active:
             self.hh_pressure_active = False
             self.ll_tank_level_active = False
-            self.dashboard_interface.clear_faults()
-            await self.update_pump1_leds()
-            await self.update_pump2_leds()
+            self._publish_faults()
+            await asyncio.gather(self.update_pump1_leds(), self.update_pump2_leds())
             return
         self.dashboard_interface.toggleSelectedPump()
         
@@ -243,19 +387,63 @@ class NapdLocalControlApplication(Application):
         await self.update_pump_state_tag(pump_number, 0)
         
     async def update_pump_state_tag(self, pump_number, state):
-        
-        if pump_number == 1:
-            await self.set_tag("StateControlTag", state, self.config.pump_1.value)
-        elif pump_number == 2:
-            await self.set_tag("StateControlTag", state, self.config.pump_2.value)
+        pump_app = self._pump_ids.get(pump_number)
+        if pump_app:
+            await self.set_tag("StateControlTag", state, pump_app)
         
 
-    async def update_dashboard_data(self):
-        """Update dashboard with data from various sources."""
-        # try:
-            # Get pump control data from simulators
-        pump_state = self.get_tag("AppState", self.config.pump_1.value)
-        pump_2_state = self.get_tag("AppState", self.config.pump_2.value)
+    def _subscribe_dashboard_tags(self):
+        """Subscribe to every tag the dashboard is built from."""
+        self._dashboard_subscribed = True
+        self._subscribe_dashboard_tag(self._pump1_id, "TargetRate")
+        self._subscribe_dashboard_tag(self._pump1_id, "FlowRate")
+        self._subscribe_dashboard_tag(self._pump2_id, "TargetRate")
+        self._subscribe_dashboard_tag(self._pump2_id, "FlowRate")
+        
+        for solar_app_id in self._solar_app_ids:
+            self._subscribe_dashboard_tag(solar_app_id, "b_voltage")
+            self._subscribe_dashboard_tag(solar_app_id, "b_percent")
+            self._subscribe_dashboard_tag(solar_app_id, "panel_voltage")
+            self._subscribe_dashboard_tag(solar_app_id, "remaining_ah")
+        
+        self._subscribe_dashboard_tag(self._tank_level_app_id, "level_reading")
+        self._subscribe_dashboard_tag(self._tank_level_app_id, "level_filled_percentage")
+        
+        # self._subscribe_dashboard_tag(self.config.flow_sensor_app.value, "value")
+        self._subscribe_dashboard_tag(self._pressure_sensor_app_id, "value")
+    
+    def _subscribe_dashboard_tag(self, app_key: str, tag_key: str):
+        """Seed a numeric dashboard tag from the current tag values and keep it updated on change.
+        
+        Values are converted to float (or None) as they arrive, not every time the dashboard is built.
+        """
+        if not app_key:
+            return
+        
+        def on_change(_tag_key, new_value):
+            # pydoover keeps the callbacks of apps swapped out of the config, which are no longer seeded
+            if (app_key, tag_key) not in self._dashboard_state:
+                return
+            self._dashboard_state[(app_key, tag_key)] = _to_float(new_value)
+            self._dirty = True
+        
+        self._dashboard_state[(app_key, tag_key)] = self.get_tag_float(tag_key, app_key)
+        self.subscribe_to_tag(tag_key, on_change, app_key)
+        self._dirty = True
+    
+    async def update_pump_states(self):
+        """Sync pump app states, faults and LEDs."""
+        get = self.get_tag
+        pump_state = get("AppState", self._pump1_id)
+        pump_2_state = get("AppState", self._pump2_id)
+        
+        if not self._latch_faults:
+            # Faults follow the pump states rather than waiting for the selector button. Clear those
+            # neither pump reports now that both states are read; the callbacks raise any new ones.
+            pump_states = (pump_state, pump_2_state)
+            for fault_state, fault_flag in self._FAULT_FLAGS.items():
+                if fault_state not in pump_states:
+                    setattr(self, fault_flag, False)
         
         # if pump_state != self.p1_app_state or pump_state in ["tank_level_low_low_level", "pressure_high_high_level"]:
         self.p1_app_state = pump_state
@@ -263,95 +451,75 @@ class NapdLocalControlApplication(Application):
         # if pump_2_state != self.p2_app_state or pump_2_state in ["tank_level_low_low_level", "pressure_high_high_level"]:
         self.p2_app_state = pump_2_state
         await self.pump_2_state_change_cb(None, pump_2_state)
-        
-        
-        target_rate = self.get_tag("TargetRate", self.config.pump_1.value)
-        flow_rate = self.get_tag("FlowRate", self.config.pump_1.value)
-        # pump_state = self.get_tag("StateString", self.config.pump_1.value)
+
+    async def update_dashboard_data(self):
+        """Push dashboard data built from the subscribed tag values, if any of them changed.
+        
+        Skipped while no client is watching the dashboard; the changes stay pending until one connects.
+        A new client first sees the data as of the last push, then main_loop pushes the pending changes
+        on its next tick (new Socket.IO clients get them in the next broadcast, /api/data on its next poll).
+        Pump states and faults are pushed separately, so they are never held back.
+        """
+        if not self._dirty or not self.dashboard_interface.has_subscribers():
+            return
+        self._dirty = False
+        # bind the lookups once, they are hit several times per solar controller
+        get = self._dashboard_state.get
+        p1 = self._pump1_id
+        p2 = self._pump2_id
+        tank_app = self._tank_level_app_id
+        
+        target_rate = get((p1, "TargetRate"))
+        flow_rate = get((p1, "FlowRate"))
         pump_data = {}
         if target_rate is not None:
             pump_data["target_rate"] = target_rate
         if flow_rate is not None:
             pump_data["flow_rate"] = flow_rate
-        # if pump_state is not None:
-        #     pump_data["pump_state"] = pump_state
-        # Get pump 2 control data from simulators
-        # if len(self.config.pump_controllers.elements) > 1:
-        pump2_target_rate = self.get_tag("TargetRate", self.config.pump_2.value)
-        pump2_flow_rate = self.get_tag("FlowRate", self.config.pump_2.value)
-        # pump2_pump_state = self.get_tag("StateString", self.config.pump_2.value)
+        
+        pump2_target_rate = get((p2, "TargetRate"))
+        pump2_flow_rate = get((p2, "FlowRate"))
         pump2_data = {}
         if pump2_target_rate is not None:
             pump2_data["target_rate"] = pump2_target_rate
         if pump2_flow_rate is not None:
             pump2_data["flow_rate"] = pump2_flow_rate
-        # if pump2_pump_state is not None:
-        #     pump2_data["pump_state"] = pump2_pump_state
-        # else:
-        #     # Fallback values for pump 2 if not configured
-        #     pump2_target_rate = "-"
-        #     pump2_flow_rate = "-"
-        #     pump2_pump_state = "-"
-        
-        # Get and aggregate solar control data from all simulators
-        solar_data = {}
-        if self.config.solar_controllers:
-            battery_voltages = []
-            battery_percentages = []
-            panel_voltage_values = []
-            battery_ah_values = []
-            
-            # Collect data from all solar controllers
-            for solar_controller in self.config.solar_controllers.elements:
-                r = self.get_tag("b_voltage", solar_controller.value)
-                if r is not None:
-                    battery_voltages.append(float(r))
-                    
-                r = self.get_tag("b_percent", solar_controller.value)
-                if r is not None:
-                    battery_percentages.append(float(r))
-                r = self.get_tag("panel_voltage", solar_controller.value)
-                
-                if r is not None:
-                    panel_voltage_values.append(float(r))
-                r = self.get_tag("remaining_ah", solar_controller.value)
-                if r is not None:
-                    battery_ah_values.append(float(r))
-            
-            # Aggregate data: average voltages/percentages, sum battery_ah
-            if battery_voltages:
-                battery_voltage = sum(battery_voltages) / len(battery_voltages)
-            else:
-                battery_voltage = 0.0
-            if battery_percentages:
-                battery_percentage = sum(battery_percentages) / len(battery_percentages)
-            else:
-                battery_percentage = 0.0
-            if panel_voltage_values:
-                panel_voltage = sum(panel_voltage_values) / len(panel_voltage_values)
-                if panel_voltage < 0:
-                    panel_voltage = 0.0
-            else:
-                panel_voltage = 0.0
-            
-            if battery_ah_values:
-                battery_ah = sum(battery_ah_values) 
-            else:
-                battery_ah = 0.0
-
-            solar_data = {
-                "battery_voltage": battery_voltage,
-                "battery_percentage": battery_percentage,
-                "panel_power": panel_voltage,
-                "battery_ah": battery_ah,
-            }
-            
-        # Get tank control data from simulators
-        tank_level_m = self.get_tag("level_reading", self.config.tank_level_app.value) if self.config.tank_level_app.value else None
+        
+        # Aggregate solar control data from all controllers in a single pass:
+        # average voltages/percentages, sum battery_ah
+        bv_sum = bp_sum = pv_sum = ah_sum = 0.0
+        bv_count = bp_count = pv_count = 0
+        
+        for solar_app_id in self._solar_app_ids:
+            r = get((solar_app_id, "b_voltage"))
+            if r is not None:
+                bv_sum += r
+                bv_count += 1
+            r = get((solar_app_id, "b_percent"))
+            if r is not None:
+                bp_sum += r
+                bp_count += 1
+            r = get((solar_app_id, "panel_voltage"))
+            if r is not None:
+                pv_sum += r
+                pv_count += 1
+            r = get((solar_app_id, "remaining_ah"))
+            if r is not None:
+                ah_sum += r
+        
+        panel_voltage = pv_sum / pv_count if pv_count else 0.0
+        solar_data = {
+            "battery_voltage": bv_sum / bv_count if bv_count else 0.0,
+            "battery_percentage": bp_sum / bp_count if bp_count else 0.0,
+            "panel_power": max(panel_voltage, 0.0),
+            "battery_ah": ah_sum,
+        }
+        
+        tank_level_m = get((tank_app, "level_reading"))
         tank_level_mm = None
         if tank_level_m is not None:
             tank_level_mm = tank_level_m * 1000
-        tank_level_percent = self.get_tag("level_filled_percentage", self.config.tank_level_app.value) if self.config.tank_level_app.value else None
+        tank_level_percent = get((tank_app, "level_filled_percentage"))
 
         tank_data = {}
         if tank_level_mm is not None:
@@ -359,8 +527,8 @@ class NapdLocalControlApplication(Application):
         if tank_level_percent is not None:
             tank_data["tank_level_percent"] = tank_level_percent
 
-        # skid_flow = self.get_tag("value", self.config.flow_sensor_app.value)
-        skid_pressure = self.get_tag("value", self.config.pressure_sensor_app.value)
+        # skid_flow = get((self.config.flow_sensor_app.value, "value"))
+        skid_pressure = get((self._pressure_sensor_app_id, "value"))
         skid_data = {}
         # if skid_flow is not None:
         #     skid_data["skid_flow"] = skid_flow
@@ -379,14 +547,18 @@ class NapdLocalControlApplication(Application):
         if skid_data:
             update_payload["skid"] = skid_data
 
-        if update_payload:
-            self.dashboard_interface.dashboard.update_data(**update_payload)
-            
-            # Update system status
-            # system_status = "running" if self.state.state == "on" else "standby"
-            # self.dashboard_interface.update_system_status(system_status)
-            
-        # except Exception as e:
-        #     log.error(f"Error updating dashboard data: {e}")
-        #     # Use fallback data if simulators are not available
-        #     self.update_dashboard_with_fallback_data()
\ No newline at end of file
+        try:
+            self._dash_queue.put_nowait(update_payload)
+        except asyncio.QueueFull:
+            # each snapshot is complete, so drop the oldest and keep the newest
+            self._dash_queue.get_nowait()
+            self._dash_queue.put_nowait(update_payload)
+    
+    async def _dash_worker(self):
+        """Push queued dashboard snapshots to the dashboard interface."""
+        while True:
+            snapshot = await self._dash_queue.get()
+            try:
+                self.dashboard_interface.update_all(snapshot)
+            except Exception as e:
+                log.error(f"Error updating dashboard data: {e}")
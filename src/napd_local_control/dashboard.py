@@ -1,49 +1,218 @@
 import asyncio
-import json
 import logging
-import math
+import queue
 import threading
 import time
+from array import array
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+import orjson
 from flask import Flask, render_template, request
 from flask_socketio import SocketIO, emit
-import socketio
+
+__all__ = ["DashboardData", "NAPDDashboard", "DashboardInterface"]
 
 log = logging.getLogger(__name__)
 
+# Seconds a section update may wait to be coalesced with others before it is flushed to the dashboard.
+# Fast-moving pump/skid readings flush quickly, slow-moving solar/tank readings can wait longer.
+DEFAULT_FLUSH_INTERVAL = 0.15
+SECTION_FLUSH_INTERVALS = {
+    "pump": 0.15,
+    "pump2": 0.15,
+    "skid": 0.15,
+    "solar": 0.5,
+    "tank": 0.5,
+    "system": 0.15,
+    "faults": 0.0,
+}
+
+# A REST client that fetched /api/data within this many seconds still counts as watching the dashboard
+HTTP_SUBSCRIBER_TIMEOUT = 5.0
+
+# Seconds between background heartbeat/broadcast ticks, and the pause after a tick fails
+BACKGROUND_UPDATE_INTERVAL = 1.0
+BACKGROUND_ERROR_BACKOFF = 5.0
+
+# Seconds a /api/health response is reused for by repeated probes
+HEALTH_CACHE_SECONDS = 0.5
+
+# Attempts a reader makes at a consistent snapshot before settling for the last cached one
+SNAPSHOT_RETRIES = 100
+
+# (section, key, attribute, tolerance) for each numeric field accepted by DashboardData.update_from_dict
+_NUMERIC_FIELDS = (
+    ("pump", "target_rate", "target_rate", 0.05),
+    ("pump", "flow_rate", "flow_rate", 0.05),
+    ("pump2", "target_rate", "pump2_target_rate", 0.05),
+    ("pump2", "flow_rate", "pump2_flow_rate", 0.05),
+    ("solar", "battery_voltage", "battery_voltage", 0.1),
+    ("solar", "battery_percentage", "battery_percentage", 0.2),
+    ("solar", "panel_power", "panel_power", 0.1),
+    ("solar", "battery_ah", "battery_ah", 0.1),
+    ("tank", "tank_level_mm", "tank_level_mm", 1.0),
+    ("tank", "tank_level_percent", "tank_level_percent", 1),
+    ("skid", "skid_flow", "skid_flow", 0.1),
+    ("skid", "skid_pressure", "skid_pressure", 10),
+)
+
+_NUMERIC_TOLERANCES = tuple(tolerance for _section, _key, _attr, tolerance in _NUMERIC_FIELDS)
+
+# String values _to_bool treats as true
+_TRUE_STRINGS = frozenset(("true", "1", "yes", "on"))
+
+# Positions of the numeric fields in DashboardData._vals, in _NUMERIC_FIELDS order
+IDX_TARGET_RATE = 0
+IDX_FLOW_RATE = 1
+IDX_PUMP2_TARGET_RATE = 2
+IDX_PUMP2_FLOW_RATE = 3
+IDX_BATTERY_VOLTAGE = 4
+IDX_BATTERY_PERCENTAGE = 5
+IDX_PANEL_POWER = 6
+IDX_BATTERY_AH = 7
+IDX_TANK_LEVEL_MM = 8
+IDX_TANK_LEVEL_PERCENT = 9
+IDX_SKID_FLOW = 10
+IDX_SKID_PRESSURE = 11
+
+# (section, key, attribute) for each string field
+_STRING_FIELDS = (
+    ("pump", "pump_state", "pump_state"),
+    ("pump2", "pump_state", "pump2_pump_state"),
+    ("system", "status", "system_status"),
+)
+
+
+def _diff_mask(old, new, tolerances) -> list:
+    """Compare aligned batches of numeric field values and return the indices that changed.
+    
+    Entries of new that are None were not supplied and are skipped. Finite values change once they move
+    beyond their tolerance, anything else (NaN/inf) only when it is not equal.
+    """
+    changed = []
+    for index, new_value in enumerate(new):
+        if new_value is None:
+            continue
+        old_value = old[index]
+        tolerance = tolerances[index]
+        # a NaN difference (NaN or infinite operands) fails the range check and falls through
+        difference = new_value - old_value
+        if -tolerance <= difference <= tolerance:
+            continue
+        # only equal infinities are left to catch, so this is off the common "no change" path
+        if old_value == new_value:
+            continue
+        changed.append(index)
+    return changed
+
+
+# pump_selection_changed payloads pre-encoded up to the timestamp, for each pump that can be selected
+_PUMP_SELECTION_PREFIXES = {
+    1: b'{"selected_pump":1,"timestamp":"',
+    2: b'{"selected_pump":2,"timestamp":"',
+}
+
+
+def _pump_selection_payload(selected_pump: int) -> bytes:
+    """Build the JSON-encoded pump_selection_changed payload, sent to clients as a binary attachment."""
+    return _PUMP_SELECTION_PREFIXES[selected_pump] + datetime.now().isoformat().encode() + b'"}'
+
+
+class _ORJSONCodec:
+    """json-module compatible codec so Socket.IO packets are encoded with orjson."""
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        # Socket.IO passes json.dumps style kwargs (separators), orjson output is already compact
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(s, **kwargs) -> Any:
+        return orjson.loads(s)
+
+
+# Section order of the dashboard snapshot, and the fault flags it carries
+_SNAPSHOT_SECTIONS = ("pump", "pump2", "solar", "tank", "skid", "system", "faults")
+_FAULT_KEYS = ("hh_pressure", "ll_tank_level")
+
+
+def _make_build_dict():
+    """Generate DashboardData._build_dict from the field tables.
+    
+    The snapshot always has the same shape, so it is compiled once into a single dict literal of
+    buffer and attribute reads, with no loops or lookups by name when it runs.
+    """
+    entries = {section: [] for section in _SNAPSHOT_SECTIONS}
+    entries["system"].append(("timestamp", "self.timestamp"))
+    for index, (section, key, _attr, _tolerance) in enumerate(_NUMERIC_FIELDS):
+        entries[section].append((key, f"vals[{index}]"))
+    for section, key, attr in _STRING_FIELDS:
+        entries[section].append((key, f"self.{attr}"))
+    for key in _FAULT_KEYS:
+        entries["faults"].append((key, f"faults[{key!r}]"))
+    
+    sections = ", ".join(
+        f"{section!r}: {{" + ", ".join(f"{key!r}: {expr}" for key, expr in fields) + "}"
+        for section, fields in entries.items()
+    )
+    source = (
+        "def _build_dict(self):\n"
+        "    vals = self._vals\n"
+        "    faults = self.faults\n"
+        f"    return {{{sections}}}\n"
+    )
+    namespace = {}
+    exec(compile(source, "<DashboardData._build_dict>", "exec"), namespace)
+    return namespace["_build_dict"]
+
+
+def _numeric_field(index: int) -> property:
+    """Read-only attribute access to one slot of DashboardData._vals, which update_from_dict writes."""
+    def getter(self) -> float:
+        return self._vals[index]
+    
+    return property(getter)
+
 
 class DashboardData:
-    """Container for dashboard data with validation and default values."""
+    """Container for dashboard data with validation and default values.
+    
+    Only the dashboard's background thread writes it (update_from_dict and _touch); other threads
+    change it by queueing updates with NAPDDashboard.update_data, and read it from any thread.
+    """
+    
+    __slots__ = (
+        "_vals", "pump_state", "pump2_pump_state", "_ts", "_ts_datetime", "system_status", "faults",
+        "_version", "_cached_dict", "_cached_json",
+    )
+    
+    target_rate = _numeric_field(IDX_TARGET_RATE)
+    flow_rate = _numeric_field(IDX_FLOW_RATE)
+    pump2_target_rate = _numeric_field(IDX_PUMP2_TARGET_RATE)
+    pump2_flow_rate = _numeric_field(IDX_PUMP2_FLOW_RATE)
+    battery_voltage = _numeric_field(IDX_BATTERY_VOLTAGE)
+    battery_percentage = _numeric_field(IDX_BATTERY_PERCENTAGE)
+    panel_power = _numeric_field(IDX_PANEL_POWER)
+    battery_ah = _numeric_field(IDX_BATTERY_AH)
+    tank_level_mm = _numeric_field(IDX_TANK_LEVEL_MM)
+    tank_level_percent = _numeric_field(IDX_TANK_LEVEL_PERCENT)
+    skid_flow = _numeric_field(IDX_SKID_FLOW)
+    skid_pressure = _numeric_field(IDX_SKID_PRESSURE)
     
     def __init__(self):
-        # Pump Control Data
-        self.target_rate: float = 0.0
-        self.flow_rate: float = 0.0
-        self.pump_state: str = "standby"
+        # Numeric fields (pump, pump 2, solar, tank and skid readings) live in one buffer, see _NUMERIC_FIELDS
+        self._vals = array("d", bytes(8 * len(_NUMERIC_FIELDS)))
         
-        # Pump 2 Control Data
-        self.pump2_target_rate: float = 0.0
-        self.pump2_flow_rate: float = 0.0
+        # Pump states
+        self.pump_state: str = "standby"
         self.pump2_pump_state: str = "standby"
         
-        # Solar Control Data
-        self.battery_voltage: float = 0.0
-        self.battery_percentage: float = 0.0
-        self.panel_power: float = 0.0
-        self.battery_ah: float = 0.0
-        
-        # Tank Control Data
-        self.tank_level_mm: float = 0.0
-        self.tank_level_percent: float = 0.0
-        
-        # Skid Control Data
-        self.skid_flow: float = 0.0
-        self.skid_pressure: float = 0.0
-        
         # System Data
-        self.timestamp: datetime = datetime.now()
+        # Last update time as time.time(); the datetime is only built when a snapshot or heartbeat needs it.
+        # It is cached as (time it was built from, datetime), so a stale one can be recognised.
+        self._ts: float = time.time()
+        self._ts_datetime: Optional[tuple] = None
         self.system_status: str = "running"
         
         # Fault Data
@@ -51,141 +220,147 @@ class DashboardData:
             "hh_pressure": False,
             "ll_tank_level": False
         }
+        
+        # Write version: odd while a write is in progress, bumped to the next even number when it is done.
+        # There is a single writer (the dashboard's background thread), so readers on other threads need
+        # no lock; they retry if the version moved while they were building a snapshot.
+        self._version = 0
+        # Snapshot caches as (version, snapshot), only valid while the version is unchanged
+        self._cached_dict: Optional[tuple] = None
+        self._cached_json: Optional[tuple] = None
+    
+    def _begin_write(self):
+        self._version += 1
+    
+    def _end_write(self):
+        self._version += 1
+    
+    @property
+    def timestamp(self) -> datetime:
+        ts = self._ts
+        cached = self._ts_datetime
+        if cached is None or cached[0] != ts:
+            cached = (ts, datetime.fromtimestamp(ts))
+            self._ts_datetime = cached
+        return cached[1]
+    
+    def _touch(self):
+        """Refresh the timestamp. Writer thread only, like update_from_dict."""
+        self._begin_write()
+        self._ts = time.time()
+        self._end_write()
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "pump": {
-                "target_rate": self.target_rate,
-                "flow_rate": self.flow_rate,
-                "pump_state": self.pump_state
-            },
-            "pump2": {
-                "target_rate": self.pump2_target_rate,
-                "flow_rate": self.pump2_flow_rate,
-                "pump_state": self.pump2_pump_state
-            },
-            "solar": {
-                "battery_voltage": self.battery_voltage,
-                "battery_percentage": self.battery_percentage,
-                "panel_power": self.panel_power,
-                "battery_ah": self.battery_ah
-            },
-            "tank": {
-                "tank_level_mm": self.tank_level_mm,
-                "tank_level_percent": self.tank_level_percent
-            },
-            "skid": {
-                "skid_flow": self.skid_flow,
-                "skid_pressure": self.skid_pressure
-            },
-            "system": {
-                "timestamp": self.timestamp.isoformat(),
-                "status": self.system_status
-            },
-            "faults": {
-                "hh_pressure": self.faults["hh_pressure"],
-                "ll_tank_level": self.faults["ll_tank_level"]
-            }
-        }
+        """Convert to dictionary for JSON serialization.
+        
+        The timestamp is left as a datetime; orjson encodes it as ISO 8601.
+        The result is cached until the next change and shared between callers, so it must not be modified.
+        If the writer keeps the data busy for SNAPSHOT_RETRIES attempts, the last cached snapshot is returned.
+        """
+        for _ in range(SNAPSHOT_RETRIES):
+            version = self._version
+            cached = self._cached_dict
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            if version & 1:
+                # a write is in progress, let the writer finish
+                time.sleep(0)
+                continue
+            snapshot = self._build_dict()
+            if self._version == version:
+                self._cached_dict = (version, snapshot)
+                return snapshot
+        
+        cached = self._cached_dict
+        return cached[1] if cached is not None else self._build_dict()
+    
+    def to_json_bytes(self) -> bytes:
+        """Return the to_dict snapshot encoded as JSON, cached until the next change."""
+        for _ in range(SNAPSHOT_RETRIES):
+            version = self._version
+            cached = self._cached_json
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            encoded = orjson.dumps(self.to_dict())
+            if self._version == version and not version & 1:
+                self._cached_json = (version, encoded)
+                return encoded
+        
+        cached = self._cached_json
+        return cached[1] if cached is not None else orjson.dumps(self.to_dict())
+    
+    # Generated from the field tables, see _make_build_dict
+    _build_dict = _make_build_dict()
     
     @staticmethod
     def _to_bool(value: Any, default: bool = False) -> bool:
         """Convert a value to boolean with fallback."""
-        if isinstance(value, bool):
+        # exact-type check first, faults arrive as plain bools almost every time
+        if type(value) is bool:
             return value
         if isinstance(value, (int, float)):
             return value != 0
         if isinstance(value, str):
-            return value.strip().lower() in {"true", "1", "yes", "on"}
+            return value.strip().lower() in _TRUE_STRINGS
         return default
     
-    def _update_numeric(self, attr: str, value: Any, tolerance: float = 0.0) -> bool:
-        """Update a numeric attribute if it changes beyond tolerance."""
-        if value is None:
-            return False
-        try:
-            new_value = float(value)
-        except (TypeError, ValueError):
-            return False
-        
-        current_value = getattr(self, attr)
-        if isinstance(current_value, (int, float)) and isinstance(new_value, (int, float)):
-            if math.isfinite(current_value) and math.isfinite(new_value):
-                if abs(current_value - new_value) <= tolerance:
-                    return False
-            elif current_value == new_value:
-                return False
-        elif current_value == new_value:
-            return False
-        
-        setattr(self, attr, new_value)
-        return True
-    
-    def _update_string(self, attr: str, value: Any) -> bool:
-        """Update a string attribute if the value changed."""
-        if value is None:
-            return False
-        new_value = str(value)
-        current_value = getattr(self, attr)
-        if current_value == new_value:
-            return False
-        setattr(self, attr, new_value)
-        return True
-    
     def update_from_dict(self, data: Dict[str, Any]) -> bool:
-        """Update from dictionary with validation. Returns True if data changed."""
-        changed = False
-        
-        if "pump" in data:
-            pump = data["pump"]
-            changed |= self._update_numeric("target_rate", pump.get("target_rate"), tolerance=0.05)
-            changed |= self._update_numeric("flow_rate", pump.get("flow_rate"), tolerance=0.05)
-            changed |= self._update_string("pump_state", pump.get("pump_state", self.pump_state))
-        
-        if "pump2" in data:
-            pump2 = data["pump2"]
-            changed |= self._update_numeric("pump2_target_rate", pump2.get("target_rate"), tolerance=0.05)
-            changed |= self._update_numeric("pump2_flow_rate", pump2.get("flow_rate"), tolerance=0.05)
-            changed |= self._update_string("pump2_pump_state", pump2.get("pump_state", self.pump2_pump_state))
-        
-        if "solar" in data:
-            solar = data["solar"]
-            changed |= self._update_numeric("battery_voltage", solar.get("battery_voltage"), tolerance=0.1)
-            changed |= self._update_numeric("battery_percentage", solar.get("battery_percentage"), tolerance=0.2)
-            changed |= self._update_numeric("panel_power", solar.get("panel_power"), tolerance=0.1)
-            changed |= self._update_numeric("battery_ah", solar.get("battery_ah"), tolerance=0.1)
-        
-        if "tank" in data:
-            tank = data["tank"]
-            changed |= self._update_numeric("tank_level_mm", tank.get("tank_level_mm"), tolerance=1.0)
-            changed |= self._update_numeric("tank_level_percent", tank.get("tank_level_percent"), tolerance=1)
-        
-        if "skid" in data:
-            skid = data["skid"]
-            changed |= self._update_numeric("skid_flow", skid.get("skid_flow"), tolerance=0.1)
-            changed |= self._update_numeric("skid_pressure", skid.get("skid_pressure"), tolerance=10)
-        
-        if "system" in data:
-            system = data["system"]
-            changed |= self._update_string("system_status", system.get("status", self.system_status))
-        
-        if "faults" in data:
-            faults = data["faults"]
-            if isinstance(faults, dict):
-                if "hh_pressure" in faults:
-                    new_value = self._to_bool(faults.get("hh_pressure"), self.faults["hh_pressure"])
-                    if self.faults["hh_pressure"] != new_value:
-                        self.faults["hh_pressure"] = new_value
-                        changed = True
-                if "ll_tank_level" in faults:
-                    new_value = self._to_bool(faults.get("ll_tank_level"), self.faults["ll_tank_level"])
-                    if self.faults["ll_tank_level"] != new_value:
-                        self.faults["ll_tank_level"] = new_value
-                        changed = True
+        """Update from dictionary with validation. Returns True if data changed.
         
+        Writer thread only; other threads go through NAPDDashboard.update_data.
+        """
+        # stage the supplied numeric values, then compare them against the current ones in one batch
+        staged = [None] * len(_NUMERIC_FIELDS)
+        supplied = False
+        for index, (section, key, _attr, _tolerance) in enumerate(_NUMERIC_FIELDS):
+            section_data = data.get(section)
+            if section_data is None:
+                continue
+            value = section_data.get(key)
+            if value is None:
+                continue
+            try:
+                staged[index] = float(value)
+            except (TypeError, ValueError):
+                continue
+            supplied = True
+        
+        # work out every change first, so they can be applied in one write
+        changed_numeric = _diff_mask(self._vals, staged, _NUMERIC_TOLERANCES) if supplied else ()
+        
+        changed_strings = []
+        for section, key, attr in _STRING_FIELDS:
+            section_data = data.get(section)
+            if section_data is None:
+                continue
+            value = section_data.get(key)
+            if value is None:
+                continue
+            new_value = str(value)
+            if getattr(self, attr) != new_value:
+                changed_strings.append((attr, new_value))
+        
+        changed_faults = []
+        faults = data.get("faults")
+        if isinstance(faults, dict):
+            for key in _FAULT_KEYS:
+                if key in faults:
+                    new_value = self._to_bool(faults.get(key), self.faults[key])
+                    if self.faults[key] != new_value:
+                        changed_faults.append((key, new_value))
+        
+        changed = bool(changed_numeric or changed_strings or changed_faults)
         if changed:
-            self.timestamp = datetime.now()
+            self._begin_write()
+            vals = self._vals
+            for index in changed_numeric:
+                vals[index] = staged[index]
+            for attr, new_value in changed_strings:
+                setattr(self, attr, new_value)
+            for key, new_value in changed_faults:
+                self.faults[key] = new_value
+            self._ts = time.time()
+            self._end_write()
         return changed
 
 
@@ -204,14 +379,33 @@ class NAPDDashboard:
                         static_folder='static')
         self.app.config['SECRET_KEY'] = 'sia_dashboard_secret_key'
         
-        # Create SocketIO instance
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        # Load the page template once rather than looking it up on every request
+        with self.app.app_context():
+            self._index_template = self.app.jinja_env.get_template('dashboard.html')
+        
+        # Create SocketIO instance. Threading is the mode this app runs in, naming it skips probing for eventlet/gevent.
+        self.socketio = SocketIO(self.app, async_mode="threading", cors_allowed_origins="*", json=_ORJSONCodec)
         
         # Dashboard data container
         self.data = DashboardData()
         
-        # Connection tracking
-        self.connected_clients = set()
+        # Connection tracking: Socket.IO sids (str hashes are cached, so membership is already cheap)
+        self.connected_clients: set = set()
+        self.last_http_fetch = 0.0  # time.monotonic() of the last /api/data request
+        # Set when a client starts watching, so the app pushes fresh data without waiting for its next update
+        self.refresh_requested = False
+        # (time.monotonic() it was built, encoded body) of the last health response
+        self._last_health = (0.0, b'')
+        
+        # Last snapshot broadcast to clients, so only changed fields are sent
+        self._last_broadcast: Dict[str, Dict[str, Any]] = {}
+        # Data changed since the last broadcast; picked up by the 1 Hz background thread
+        self._dirty = False
+        # Updates from any thread are queued and applied by the background thread, the only writer of self.data
+        self._update_q: queue.SimpleQueue = queue.SimpleQueue()
+        # Set by forced updates and stop() to wake the background thread early
+        self._wake = threading.Event()
+        self._force_broadcast = False
         
         # Setup routes and event handlers
         self._setup_routes()
@@ -219,24 +413,37 @@ class NAPDDashboard:
         
         # Background thread for data updates
         self._update_thread = None
-        self._running = False
+        self._stop_event = threading.Event()
     
     def _setup_routes(self):
         """Setup Flask routes."""
         
         @self.app.route('/')
         def index():
-            return render_template('dashboard.html')
+            return render_template(self._index_template)
         
         @self.app.route('/api/data')
         def get_data():
-            """REST API endpoint to get current data."""
-            return self.data.to_dict()
+            """REST API endpoint to get current data.
+            
+            The app stops pushing readings while nobody watches, so the first response after more than
+            HTTP_SUBSCRIBER_TIMEOUT without a request can be stale; it requests a refresh for the next one.
+            """
+            now = time.monotonic()
+            if now - self.last_http_fetch >= HTTP_SUBSCRIBER_TIMEOUT:
+                self.refresh_requested = True
+            self.last_http_fetch = now
+            return self.app.response_class(self.data.to_json_bytes(), mimetype='application/json')
         
         @self.app.route('/api/health')
         def health():
             """Health check endpoint."""
-            return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+            built, body = self._last_health
+            now = time.monotonic()
+            if not body or now - built > HEALTH_CACHE_SECONDS:
+                body = b'{"status":"healthy","timestamp":"' + datetime.now().isoformat().encode() + b'"}'
+                self._last_health = (now, body)
+            return self.app.response_class(body, mimetype='application/json')
     
     def _setup_socket_events(self):
         """Setup WebSocket event handlers."""
@@ -244,24 +451,29 @@ class NAPDDashboard:
         @self.socketio.on('connect')
         def handle_connect():
             """Handle client connection."""
-            self.connected_clients.add(request.sid)
-            log.info(f"Client connected: {request.sid}")
-            log.info(f"Total connected clients: {len(self.connected_clients)}")
+            # request.sid resolves through a context-local proxy, so look it up once
+            sid = request.sid
+            self.connected_clients.add(sid)
+            log.info("Client connected: %s (total=%d)", sid, len(self.connected_clients))
+            # Readings may be held back while nobody watched; the refresh reaches this client as a delta
+            self.refresh_requested = True
             
-            # Send current data to newly connected client
-            emit('data_update', self.data.to_dict())
+            # Send current data to newly connected client, as the cached JSON in a binary attachment
+            emit('data_update', self.data.to_json_bytes())
+            # and the current pump selection, so it doesn't have to wait for the next change
+            emit('pump_selection_changed', _pump_selection_payload(self.interface.selected_pump if self.interface else 1))
         
         @self.socketio.on('disconnect')
         def handle_disconnect():
             """Handle client disconnection."""
-            self.connected_clients.discard(request.sid)
-            log.info(f"Client disconnected: {request.sid}")
-            log.info(f"Total connected clients: {len(self.connected_clients)}")
+            sid = request.sid
+            self.connected_clients.discard(sid)
+            log.info("Client disconnected: %s (total=%d)", sid, len(self.connected_clients))
         
         @self.socketio.on('request_data')
         def handle_data_request():
             """Handle explicit data request from client."""
-            emit('data_update', self.data.to_dict())
+            emit('data_update', self.data.to_json_bytes())
         
         @self.socketio.on('request_pump_selection')
         def handle_pump_selection_request():
@@ -269,30 +481,22 @@ class NAPDDashboard:
             if self.interface:
                 # Get current pump selection from interface
                 selected_pump = self.interface.getSelectedPump()
-                emit('pump_selection_changed', {
-                    'selected_pump': selected_pump,
-                    'timestamp': datetime.now().isoformat()
-                })
+                emit('pump_selection_changed', _pump_selection_payload(selected_pump))
             else:
                 # Fallback to default
-                emit('pump_selection_changed', {
-                    'selected_pump': 1,  # Default to pump 1
-                    'timestamp': datetime.now().isoformat()
-                })
+                emit('pump_selection_changed', _pump_selection_payload(1))  # Default to pump 1
         
         @self.socketio.on('set_pump_state')
         def handle_pump_state_change(data):
             """Handle pump state change from client."""
             try:
                 if 'state' in data:
-                    self.data.pump_state = str(data['state'])
-                    self.data.timestamp = datetime.now()
-                    log.info(f"Pump state changed to: {self.data.pump_state}")
-                    
-                    # Broadcast update to all clients
-                    self.broadcast_update()
+                    log.info("Pump state change requested: %s", data['state'])
+                    # Applied by the background thread and broadcast straight away. A repeat of the
+                    # current state (double clicks, reconnect replays) is ignored there.
+                    self.update_data(force=True, pump={"pump_state": str(data['state'])})
             except Exception as e:
-                log.error(f"Error handling pump state change: {e}")
+                log.error("Error handling pump state change: %s", e)
                 emit('error', {'message': str(e)})
         
         @self.socketio.on('toggle_selected_pump')
@@ -303,29 +507,77 @@ class NAPDDashboard:
                 emit('pump_selection_toggled', {'message': 'Pump selection toggle requested'})
                 log.info("Pump selection toggle requested from client")
             except Exception as e:
-                log.error(f"Error handling pump selection toggle: {e}")
+                log.error("Error handling pump selection toggle: %s", e)
                 emit('error', {'message': str(e)})
     
     def broadcast_update(self):
-        """Broadcast data update to all connected clients."""
-        if self.connected_clients:
-            self.socketio.emit('data_update', self.data.to_dict())
+        """Broadcast the fields changed since the last broadcast to all connected clients.
+        
+        Newly connected clients get a full snapshot ('data_update') on connect, after which
+        they only receive deltas ('data_delta').
+        """
+        self._dirty = False
+        if not self.connected_clients:
+            return
+        
+        snapshot = self.data.to_dict()
+        delta = {}
+        for section, fields in snapshot.items():
+            last_fields = self._last_broadcast.get(section, {})
+            changed = {key: value for key, value in fields.items() if last_fields.get(key) != value}
+            if changed:
+                delta[section] = changed
+        self._last_broadcast = snapshot
+        
+        if delta:
+            self.socketio.emit('data_delta', delta)
     
-    def update_data(self, **kwargs):
-        """Update dashboard data and broadcast to clients."""
-        try:
-            # Update data container
-            if kwargs:
-                if self.data.update_from_dict(kwargs):
-                    self.broadcast_update()
-                    log.debug(f"Dashboard data updated: {kwargs}")
-        except Exception as e:
-            log.error(f"Error updating dashboard data: {e}")
+    def update_data(self, force: bool = False, **kwargs):
+        """Queue a dashboard data update, safe to call from any thread.
+        
+        The background thread applies queued updates and broadcasts the changes at most once a second,
+        or straight away if force is set.
+        """
+        if not kwargs:
+            return
+        self._update_q.put(kwargs)
+        if force:
+            self._force_broadcast = True
+            self._wake.set()
+    
+    def _process_updates(self):
+        """Apply all queued updates as one merged update, then broadcast now if one was forced."""
+        # update_data queues before it sets the flag, so take the flag first: a forced update queued
+        # after this point leaves it set (and the wake event) for the next pass instead of being missed
+        force = self._force_broadcast
+        self._force_broadcast = False
+        merged: Dict[str, Dict[str, Any]] = {}
+        get = self._update_q.get_nowait
+        while True:
+            try:
+                update = get()
+            except queue.Empty:
+                break
+            for section, fields in update.items():
+                # later values for the same field win, fault flags included
+                if isinstance(fields, dict):
+                    merged.setdefault(section, {}).update(fields)
+        
+        if merged:
+            try:
+                if self.data.update_from_dict(merged):
+                    self._dirty = True
+                    log.debug("Dashboard data updated: %s", merged)
+            except Exception as e:
+                log.error("Error updating dashboard data: %s", e)
+        
+        if force and self._dirty:
+            self.broadcast_update()
     
     def start(self):
         """Start the dashboard server."""
-        log.info(f"Starting SIA Dashboard on {self.host}:{self.port}")
-        self._running = True
+        log.info("Starting SIA Dashboard on %s:%s", self.host, self.port)
+        self._stop_event.clear()
         
         # Start background update thread
         self._update_thread = threading.Thread(target=self._background_updates, daemon=True)
@@ -335,25 +587,46 @@ class NAPDDashboard:
         self.socketio.run(self.app, host=self.host, port=self.port, debug=False, allow_unsafe_werkzeug=True)
     
     def _background_updates(self):
-        """Background thread for periodic updates and health monitoring."""
-        while self._running:
+        """Background thread for periodic updates and health monitoring.
+        
+        Ticks run on a fixed monotonic cadence, so sleep time is not added on top of each tick's work.
+        """
+        next_tick = time.monotonic()
+        while not self._stop_event.is_set():
             try:
-                # Update system timestamp
-                self.data.timestamp = datetime.now()
+                self._process_updates()
                 
-                # Send periodic heartbeat to clients
-                if self.connected_clients:
-                    self.socketio.emit('heartbeat', {'timestamp': self.data.timestamp.isoformat()})
-                
-                time.sleep(1)  # Update every second
+                if time.monotonic() >= next_tick:
+                    # Update system timestamp
+                    self.data._touch()
+                    
+                    # Send periodic heartbeat to clients
+                    if self.connected_clients:
+                        self.socketio.emit('heartbeat', {'timestamp': self.data.timestamp})
+                    
+                    # Broadcast the changes collected since the last tick in one go
+                    if self._dirty:
+                        self.broadcast_update()
+                    
+                    next_tick += BACKGROUND_UPDATE_INTERVAL
             except Exception as e:
-                log.error(f"Error in background updates: {e}")
-                time.sleep(5)
+                log.error("Error in background updates: %s", e)
+                next_tick = time.monotonic() + BACKGROUND_ERROR_BACKOFF
+            
+            slack = next_tick - time.monotonic()
+            if slack <= 0:
+                # fell behind (e.g. a slow emit), start again from now rather than running the missed ticks back to back
+                next_tick = time.monotonic()
+                continue
+            # returns early for forced updates and when stop() is called
+            self._wake.wait(slack)
+            self._wake.clear()
     
     def stop(self):
         """Stop the dashboard server."""
         log.info("Stopping SIA Dashboard")
-        self._running = False
+        self._stop_event.set()
+        self._wake.set()
         if self._update_thread and self._update_thread.is_alive():
             self._update_thread.join(timeout=5)
 
@@ -372,6 +645,10 @@ class DashboardInterface:
         
         self._server_thread = None
         self.selected_pump = 1  # Default to pump 1
+        
+        # Section updates waiting to be flushed to the dashboard in one batch
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
     
     def start_dashboard(self):
         """Start dashboard in a separate thread."""
@@ -382,16 +659,13 @@ class DashboardInterface:
         self._server_thread = threading.Thread(target=self._dashboard_thread_start, daemon=True)
         self._server_thread.start()
         log.info("Dashboard started in background thread")
-        
-        # Broadcast initial pump selection after a short delay
-        threading.Timer(2.0, self.broadcast_pump_selection).start()
     
     def _dashboard_thread_start(self):
         """Thread-safe dashboard startup."""
         try:
             self.dashboard.start()
         except Exception as e:
-            log.error(f"Dashboard startup failed: {e}")
+            log.error("Dashboard startup failed: %s", e)
             # Dashboard will fall back gracefully
     
     def stop_dashboard(self):
@@ -401,9 +675,62 @@ class DashboardInterface:
             self._server_thread.join(timeout=5)
         log.info("Dashboard stopped")
         
+    def _queue_update(self, section: str, data: Dict[str, Any]):
+        """Merge a section update into the pending batch and schedule a flush."""
+        self._pending.setdefault(section, {}).update(data)
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not called from the event loop, so there is nothing to coalesce with
+            self._flush()
+            return
+        
+        when = loop.time() + SECTION_FLUSH_INTERVALS.get(section, DEFAULT_FLUSH_INTERVAL)
+        if self._flush_handle is not None:
+            if self._flush_handle.when() <= when:
+                return
+            self._flush_handle.cancel()
+        self._flush_handle = loop.call_at(when, self._flush)
+    
+    def _flush(self):
+        """Send all pending section updates to the dashboard in a single update."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            # pump state and fault changes are shown straight away, readings wait for the next broadcast.
+            # Both are only queued when they change, so their presence is enough to go on.
+            force = "faults" in pending or any("pump_state" in pending.get(section, ()) for section in ("pump", "pump2"))
+            self.dashboard.update_data(force=force, **pending)
+    
+    def _pump_state_changed(self, section: str, pump_state: str) -> bool:
+        """Check whether a pump state differs from what the dashboard shows for that pump.
+        
+        The app reports both pump states every tick, and queueing an unchanged one would force a broadcast
+        each time. The comparison is against the dashboard data itself rather than a copy of what was sent,
+        so a state set from the client is still corrected by the app's next report.
+        """
+        if 'pump_state' in self._pending.get(section, ()):
+            # a different state is already waiting to be flushed, so this one has to replace it
+            return True
+        attr = 'pump_state' if section == 'pump' else 'pump2_pump_state'
+        return pump_state != getattr(self.dashboard.data, attr)
+    
+    def has_subscribers(self) -> bool:
+        """Check whether anyone is watching the dashboard, over Socket.IO or by polling /api/data."""
+        return bool(self.dashboard.connected_clients) or \
+            time.monotonic() - self.dashboard.last_http_fetch < HTTP_SUBSCRIBER_TIMEOUT
+    
+    def consume_refresh_request(self) -> bool:
+        """Check whether a client started watching since the last call, clearing the request."""
+        if not self.dashboard.refresh_requested:
+            return False
+        self.dashboard.refresh_requested = False
+        return True
+    
     def set_faults(self, hh_pressure: bool = False, ll_tank_level: bool = False):
         """Set faults."""
-        self.dashboard.update_data(faults={'hh_pressure': hh_pressure, 'll_tank_level': ll_tank_level})
+        self._queue_update('faults', {'hh_pressure': hh_pressure, 'll_tank_level': ll_tank_level})
     
     def clear_faults(self):
         """Clear faults."""
@@ -416,11 +743,11 @@ class DashboardInterface:
             pump_data['target_rate'] = target_rate
         if flow_rate is not None:
             pump_data['flow_rate'] = flow_rate
-        if pump_state is not None:
+        if pump_state is not None and self._pump_state_changed('pump', pump_state):
             pump_data['pump_state'] = pump_state
         
         if pump_data:
-            self.dashboard.update_data(pump=pump_data)
+            self._queue_update('pump', pump_data)
     
     def update_pump2_data(self, target_rate: float = None, flow_rate: float = None, pump_state: str = None):
         """Update pump 2 control data."""
@@ -429,11 +756,11 @@ class DashboardInterface:
             pump2_data['target_rate'] = target_rate
         if flow_rate is not None:
             pump2_data['flow_rate'] = flow_rate
-        if pump_state is not None:
+        if pump_state is not None and self._pump_state_changed('pump2', pump_state):
             pump2_data['pump_state'] = pump_state
         
         if pump2_data:
-            self.dashboard.update_data(pump2=pump2_data)
+            self._queue_update('pump2', pump2_data)
     
     def update_solar_data(self, battery_voltage: float = None, battery_percentage: float = None, array_voltage: float = None, battery_ah: float = None):
         """Update solar control data."""
@@ -448,7 +775,7 @@ class DashboardInterface:
             solar_data['battery_ah'] = battery_ah
         
         if solar_data:
-            self.dashboard.update_data(solar=solar_data)
+            self._queue_update('solar', solar_data)
     
     def update_tank_data(self, tank_level_mm: float = None, tank_level_percent: float = None):
         """Update tank control data."""
@@ -459,7 +786,7 @@ class DashboardInterface:
             tank_data['tank_level_percent'] = tank_level_percent
         
         if tank_data:
-            self.dashboard.update_data(tank=tank_data)
+            self._queue_update('tank', tank_data)
     
     def update_skid_data(self, skid_flow: float = None, skid_pressure: float = None):
         """Update skid control data."""
@@ -470,22 +797,25 @@ class DashboardInterface:
             skid_data['skid_pressure'] = skid_pressure
         
         if skid_data:
-            self.dashboard.update_data(skid=skid_data)
+            self._queue_update('skid', skid_data)
+    
+    def update_all(self, data: Dict[str, Dict[str, Any]]):
+        """Update several dashboard sections (pump, pump2, solar, tank, skid, ...) in one push."""
+        for section, section_data in data.items():
+            if section_data:
+                self._queue_update(section, section_data)
     
     def update_system_status(self, status: str):
         """Update system status."""
-        self.dashboard.update_data(system={'status': status})
+        self._queue_update('system', {'status': status})
     
     def toggleSelectedPump(self):
         """Toggle between pump 1 and pump 2 selection."""
         self.selected_pump = 2 if self.selected_pump == 1 else 1
-        log.info(f"Selected pump changed to: {self.selected_pump}")
+        log.info("Selected pump changed to: %s", self.selected_pump)
         
         # Emit WebSocket event to update all connected clients
-        self.dashboard.socketio.emit('pump_selection_changed', {
-            'selected_pump': self.selected_pump,
-            'timestamp': datetime.now().isoformat()
-        })
+        self.dashboard.socketio.emit('pump_selection_changed', _pump_selection_payload(self.selected_pump))
         
         return self.selected_pump
     
@@ -497,24 +827,18 @@ class DashboardInterface:
         """Set the selected pump number (1 or 2)."""
         if pump_number in [1, 2]:
             self.selected_pump = pump_number
-            log.info(f"Selected pump set to: {self.selected_pump}")
+            log.info("Selected pump set to: %s", self.selected_pump)
             
             # Emit WebSocket event to update all connected clients
-            self.dashboard.socketio.emit('pump_selection_changed', {
-                'selected_pump': self.selected_pump,
-                'timestamp': datetime.now().isoformat()
-            })
+            self.dashboard.socketio.emit('pump_selection_changed', _pump_selection_payload(self.selected_pump))
         else:
-            log.error(f"Invalid pump number: {pump_number}. Must be 1 or 2.")
+            log.error("Invalid pump number: %s. Must be 1 or 2.", pump_number)
         return self.selected_pump
     
     def broadcast_pump_selection(self):
         """Broadcast current pump selection to all connected clients."""
-        self.dashboard.socketio.emit('pump_selection_changed', {
-            'selected_pump': self.selected_pump,
-            'timestamp': datetime.now().isoformat()
-        })
-        log.info(f"Broadcasted pump selection: {self.selected_pump}")
+        self.dashboard.socketio.emit('pump_selection_changed', _pump_selection_payload(self.selected_pump))
+        log.info("Broadcasted pump selection: %s", self.selected_pump)
     
     def updateSelectedTargetRate(self, value: float):
         """Update the target rate of the currently selected pump."""
@@ -524,13 +848,13 @@ class DashboardInterface:
             elif self.selected_pump == 2:
                 self.update_pump2_data(target_rate=value)
             else:
-                log.error(f"Invalid selected pump: {self.selected_pump}")
+                log.error("Invalid selected pump: %s", self.selected_pump)
                 return False
             
-            log.info(f"Updated pump {self.selected_pump} target rate to: {value}")
+            log.info("Updated pump %s target rate to: %s", self.selected_pump, value)
             return True
         except Exception as e:
-            log.error(f"Error updating target rate for pump {self.selected_pump}: {e}")
+            log.error("Error updating target rate for pump %s: %s", self.selected_pump, e)
             return False
     
     def updateSelectedPumpState(self, state: str):
@@ -542,7 +866,7 @@ class DashboardInterface:
         try:
             # Validate state
             if state not in ["pumping", "standby"]:
-                log.error(f"Invalid pump state: {state}. Must be 'pumping' or 'standby'")
+                log.error("Invalid pump state: %s. Must be 'pumping' or 'standby'", state)
                 return False
             
             if self.selected_pump == 1:
@@ -550,11 +874,11 @@ class DashboardInterface:
             elif self.selected_pump == 2:
                 self.update_pump2_data(pump_state=state)
             else:
-                log.error(f"Invalid selected pump: {self.selected_pump}")
+                log.error("Invalid selected pump: %s", self.selected_pump)
                 return False
             
-            log.info(f"Updated pump {self.selected_pump} state to: {state}")
+            log.info("Updated pump %s state to: %s", self.selected_pump, state)
             return True
         except Exception as e:
-            log.error(f"Error updating state for pump {self.selected_pump}: {e}")
+            log.error("Error updating state for pump %s: %s", self.selected_pump, e)
             return False
@@ -104,13 +104,20 @@ class Dashboard {
         });
         
         // Data events
-        this.socket.on('data_update', (data) => {
+        this.socket.on('data_update', (payload) => {
+            const data = this.decodePayload(payload);
             console.log('Received data update:', data);
             this.data = data;
             this.updateDashboard(data);
             this.updateLastUpdateTime();
         });
         
+        this.socket.on('data_delta', (delta) => {
+            console.log('Received data delta:', delta);
+            this.applyDelta(delta);
+            this.updateLastUpdateTime();
+        });
+        
         this.socket.on('heartbeat', (data) => {
             console.log('Received heartbeat:', data);
             this.updateLastUpdateTime(data.timestamp);
@@ -122,7 +129,8 @@ class Dashboard {
         });
         
         // Pump selection events
-        this.socket.on('pump_selection_changed', (data) => {
+        this.socket.on('pump_selection_changed', (payload) => {
+            const data = this.decodePayload(payload);
             console.log('Received pump selection change:', data);
             if (data.selected_pump) {
                 this.setSelectedPump(data.selected_pump, true); // true = fromWebSocket
@@ -130,6 +138,13 @@ class Dashboard {
         });
     }
     
+    decodePayload(payload) {
+        // Some events arrive as pre-encoded JSON in a binary attachment
+        return payload instanceof ArrayBuffer
+            ? JSON.parse(new TextDecoder().decode(payload))
+            : payload;
+    }
+    
     setupEventListeners() {
         // Pump state buttons
         const pumpStateButtons = document.querySelectorAll('.state-btn[data-state]');
@@ -199,6 +214,16 @@ class Dashboard {
         }
     }
     
+    applyDelta(delta) {
+        // Merge the changed fields into the last full snapshot
+        Object.keys(delta).forEach(section => {
+            this.data[section] = Object.assign({}, this.data[section], delta[section]);
+        });
+        
+        // Only changed sections are re-rendered; faults always come from the merged state
+        this.updateDashboard(Object.assign({}, delta, { faults: this.data.faults }));
+    }
+    
     updatePumpData(pumpData) {
         // Update target rate
         if (pumpData.target_rate !== undefined) {
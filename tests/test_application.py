@@ -0,0 +1,198 @@
+"""
+Tests for the application's local signal handling.
+"""
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from pydoover.utils.kalman import KalmanFilter1D
+
+
+def test_pot_filter_matches_pydoover_kalman():
+    from napd_local_control.application import NapdLocalControlApplication, POT_PROCESS_VARIANCE, POT_MEASUREMENT_VARIANCE
+
+    # only the filter state is needed, so skip building a full application
+    filter_state = SimpleNamespace(_kf_x=None, _kf_p=0.0, _kf_t=0.0)
+    reference = KalmanFilter1D(process_variance=POT_PROCESS_VARIANCE)
+
+    now = [100.0]
+    with mock.patch("time.monotonic", lambda: now[0]), mock.patch("time.time", lambda: now[0]):
+        for sample in (5.0, 5.01, 4.99, 5.2, 9.0, 9.1, 2.0):
+            estimate = NapdLocalControlApplication.get_pot_reading(filter_state, sample)
+            assert estimate == reference.update(sample, POT_MEASUREMENT_VARIANCE)
+            now[0] += 0.2
+
+
+def test_target_rate_skips_without_pot_reading():
+    import asyncio
+    from napd_local_control.application import NapdLocalControlApplication
+
+    set_tag = mock.AsyncMock()
+    app = SimpleNamespace(
+        _kf_x=None, _kf_p=0.0, _kf_t=0.0,
+        platform_iface=SimpleNamespace(get_ai=mock.AsyncMock(return_value=None)),
+        dashboard_interface=SimpleNamespace(getSelectedPump=lambda: 1),
+        set_tag=set_tag,
+    )
+    NapdLocalControlApplication._set_last_ai_input(app, 0.0)
+    app._potentiometer_pin = 0
+    app.get_pot_reading = lambda raw: NapdLocalControlApplication.get_pot_reading(app, raw)
+
+    # first tick after startup: no sample and no filter estimate, so nothing is written
+    asyncio.run(NapdLocalControlApplication.update_target_rate(app))
+    set_tag.assert_not_called()
+
+
+def test_target_rate_deadband_holds_at_zero_and_negative_readings():
+    import asyncio
+    from napd_local_control.application import NapdLocalControlApplication
+
+    get_ai = mock.AsyncMock()
+    app = SimpleNamespace(
+        _potentiometer_pin=0,
+        platform_iface=SimpleNamespace(get_ai=get_ai),
+        get_pot_reading=mock.Mock(),
+    )
+    for resting, sample in ((0.0, 0.004), (-2.0, -2.01)):
+        NapdLocalControlApplication._set_last_ai_input(app, resting)
+        get_ai.return_value = sample
+        asyncio.run(NapdLocalControlApplication.update_target_rate(app))
+    # both samples sit inside the band, so the filter never runs
+    app.get_pot_reading.assert_not_called()
+
+
+def test_main_loop_finishes_steps_before_raising():
+    import asyncio
+    from napd_local_control.application import NapdLocalControlApplication
+
+    finished = []
+
+    async def update_target_rate():
+        raise RuntimeError("platform unavailable")
+
+    async def update_pump_states():
+        await asyncio.sleep(0)
+        finished.append("pump_states")
+        raise ValueError("bad pump state")
+
+    async def update_dashboard_data():
+        finished.append("dashboard_data")
+
+    app = SimpleNamespace(
+        _tick=0,
+        update_target_rate=update_target_rate,
+        update_pump_states=update_pump_states,
+        update_dashboard_data=update_dashboard_data,
+        dashboard_interface=SimpleNamespace(consume_refresh_request=lambda: True),
+    )
+    with mock.patch("napd_local_control.application.log") as log, pytest.raises(RuntimeError):
+        asyncio.run(NapdLocalControlApplication.main_loop(app))
+
+    assert sorted(finished) == ["dashboard_data", "pump_states"]
+    assert "update_pump_states" in log.error.call_args.args[0]
+
+
+def test_swapped_out_app_no_longer_updates_dashboard():
+    import asyncio
+    from pydoover.docker import Application
+    from napd_local_control.application import NapdLocalControlApplication
+
+    callbacks = {}
+    app = NapdLocalControlApplication.__new__(NapdLocalControlApplication)
+    app._dashboard_state, app._dashboard_subscribed, app._dirty = {}, False, False
+    app.get_tag_float = lambda tag_key, app_key: 1.0
+    app.subscribe_to_tag = lambda tag_key, callback, app_key: callbacks.__setitem__((app_key, tag_key), callback)
+
+    def cache_config(pump1_id):
+        app._pump1_id = pump1_id
+        app._pump2_id = app._tank_level_app_id = app._pressure_sensor_app_id = None
+        app._solar_app_ids = ()
+
+    cache_config("pump-a")
+    app._subscribe_dashboard_tags()
+    stale_callback = callbacks[("pump-a", "FlowRate")]
+
+    app._cache_config = lambda: cache_config("pump-b")
+    with mock.patch.object(Application, "_on_deployment_config_update", mock.AsyncMock()):
+        asyncio.run(app._on_deployment_config_update())
+    app._dirty = False
+
+    stale_callback("FlowRate", 5.0)
+    assert ("pump-a", "FlowRate") not in app._dashboard_state and not app._dirty
+    callbacks[("pump-b", "FlowRate")]("FlowRate", 5.0)
+    assert app._dashboard_state[("pump-b", "FlowRate")] == 5.0 and app._dirty
+
+
+def _pump_state_app(latch_faults):
+    from napd_local_control.application import NapdLocalControlApplication
+
+    app = NapdLocalControlApplication.__new__(NapdLocalControlApplication)
+    app.hh_pressure_active = app.ll_tank_level_active = False
+    app._faults_sent = (False, False)  # as published by setup
+    app._latch_faults = latch_faults
+    app._pump1_id, app._pump2_id = "pump-1", "pump-2"
+    app._pump_ids = {1: "pump-1", 2: "pump-2"}
+    app.app_states = {}
+    app.get_tag = lambda tag_key, app_key: app.app_states[app_key]
+    app.set_tag = mock.AsyncMock()
+    app.dashboard_interface = mock.MagicMock()
+    app.update_pump1_leds = app.update_pump2_leds = mock.AsyncMock()
+    return app
+
+
+def _run_pump_states(app, *ticks):
+    import asyncio
+
+    for pump_1_state, pump_2_state in ticks:
+        app.app_states.update({"pump-1": pump_1_state, "pump-2": pump_2_state})
+        asyncio.run(app.update_pump_states())
+
+
+def test_faults_follow_pump_states_without_latching():
+    app = _pump_state_app(latch_faults=False)
+    _run_pump_states(app, ("auto", "pressure_high_high_level"), ("auto", "pressure_high_high_level"))
+    assert app.hh_pressure_active
+    app.set_tag.assert_awaited_once_with("State", 0, "pump-2")
+
+    # pump 1's callback already sees the cleared flag, not pump 2's state from the last tick
+    _run_pump_states(app, ("auto", "auto"))
+    assert not app.hh_pressure_active
+    assert app.dashboard_interface.set_faults.call_args_list == [
+        mock.call(hh_pressure=True, ll_tank_level=False),
+        mock.call(hh_pressure=False, ll_tank_level=False),
+    ]
+
+
+def test_faults_stay_latched_until_cleared():
+    app = _pump_state_app(latch_faults=True)
+    _run_pump_states(app, ("tank_level_low_low_level", "auto"), ("auto", "auto"), ("auto", "auto"))
+    assert app.ll_tank_level_active
+    app.dashboard_interface.set_faults.assert_called_once_with(hh_pressure=False, ll_tank_level=True)
+
+
+def test_pump_leds_written_only_on_transitions():
+    import asyncio
+    from napd_local_control.application import NapdLocalControlApplication
+
+    app = NapdLocalControlApplication.__new__(NapdLocalControlApplication)
+    app.platform_iface = SimpleNamespace(set_ao=mock.AsyncMock(), set_do=mock.AsyncMock())
+    app._pump_led_pins = {1: (2, 3)}
+    app._do_shadow, app._ao_shadow = {2: False}, {3: 0.0}
+    app.hh_pressure_active = app.ll_tank_level_active = False
+    app.p1_app_state = "auto"
+
+    asyncio.run(app.update_pump1_leds())
+    asyncio.run(app.update_pump1_leds())
+    app.platform_iface.set_do.assert_awaited_once_with(2, True)
+    app.platform_iface.set_ao.assert_not_awaited()
+
+    # a failed write leaves the shadow as it was, so it is retried on the next tick
+    app.hh_pressure_active = True
+    app.platform_iface.set_ao.side_effect = OSError("platform unavailable")
+    with pytest.raises(OSError):
+        asyncio.run(app.update_pump1_leds())
+    assert app._ao_shadow == {3: 0.0}
+    app.platform_iface.set_ao.side_effect = None
+    asyncio.run(app.update_pump1_leds())
+    assert app._ao_shadow == {3: 100}
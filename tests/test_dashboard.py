@@ -0,0 +1,244 @@
+"""
+Tests for the dashboard data path.
+
+These check that only changed fields are broadcast to clients.
+"""
+import queue
+from unittest import mock
+
+from napd_local_control.dashboard import _NUMERIC_FIELDS, DashboardData, DashboardInterface, NAPDDashboard
+
+
+def test_broadcast_sends_delta():
+    dashboard = NAPDDashboard()
+    dashboard.connected_clients.add("client")
+    dashboard.socketio = mock.MagicMock()
+
+    dashboard.broadcast_update()
+    dashboard.socketio.emit.reset_mock()
+    dashboard.update_data(pump={"target_rate": 12.5})
+    dashboard._process_updates()
+    # readings wait for the next background tick
+    dashboard.socketio.emit.assert_not_called()
+    assert dashboard._dirty
+
+    dashboard.broadcast_update()
+    event, delta = dashboard.socketio.emit.call_args.args
+    assert event == "data_delta"
+    assert delta["pump"] == {"target_rate": 12.5}
+    assert set(delta) == {"pump", "system"}
+
+
+def test_api_data_is_orjson_encoded():
+    dashboard = NAPDDashboard()
+    response = dashboard.app.test_client().get("/api/data")
+
+    assert response.mimetype == "application/json"
+    assert response.get_json()["system"]["timestamp"] == dashboard.data.timestamp.isoformat()
+
+
+def test_first_fetch_after_idle_requests_refresh():
+    dashboard = NAPDDashboard()
+    interface = DashboardInterface(dashboard)
+    client = dashboard.app.test_client()
+
+    client.get("/api/data")
+    assert interface.consume_refresh_request()
+    client.get("/api/data")
+    assert not interface.consume_refresh_request()
+
+    dashboard.socketio.test_client(dashboard.app)
+    assert interface.consume_refresh_request()
+
+
+def test_snapshot_cached_until_change():
+    data = DashboardData()
+    snapshot, encoded = data.to_dict(), data.to_json_bytes()
+    assert data.to_dict() is snapshot and data.to_json_bytes() is encoded
+
+    data.update_from_dict({"faults": {"hh_pressure": True}})
+    assert data.to_dict() is not snapshot
+    assert data.to_dict()["faults"]["hh_pressure"] is True
+
+
+def test_update_from_dict_applies_tolerances():
+    data = DashboardData()
+
+    assert data.update_from_dict({"skid": {"skid_pressure": 5, "skid_flow": 1.0}, "pump2": {"pump_state": "pumping"}})
+    assert (data.skid_pressure, data.skid_flow, data.pump2_pump_state) == (0.0, 1.0, "pumping")
+    assert not data.update_from_dict({"pump": {"target_rate": "0.01"}, "tank": {"tank_level_mm": "bad"}})
+    assert data.update_from_dict({"tank": {"tank_level_percent": float("nan")}})
+
+
+def test_numeric_fields_aligned_with_buffer():
+    data = DashboardData()
+    for index, (section, key, attr, _tolerance) in enumerate(_NUMERIC_FIELDS):
+        data._begin_write()
+        data._vals[index] = index + 0.5
+        data._end_write()
+        assert getattr(data, attr) == index + 0.5
+        assert data.to_dict()[section][key] == index + 0.5
+
+
+def test_snapshot_read_gives_up_waiting_for_a_stuck_writer():
+    data = DashboardData()
+    snapshot = data.to_dict()
+    encoded = data.to_json_bytes()
+
+    data._begin_write()
+    assert data.to_dict() is snapshot
+    assert data.to_json_bytes() is encoded
+
+
+def test_forced_update_broadcasts_immediately():
+    dashboard = NAPDDashboard()
+    dashboard.connected_clients.add("client")
+    dashboard.socketio = mock.MagicMock()
+
+    dashboard.update_data(force=True, faults={"hh_pressure": True})
+    assert dashboard._wake.is_set()
+    dashboard._process_updates()
+
+    event, delta = dashboard.socketio.emit.call_args.args
+    assert event == "data_delta" and delta["faults"]["hh_pressure"] is True
+
+
+def test_forced_update_queued_while_draining_is_not_lost():
+    dashboard = NAPDDashboard()
+    dashboard.connected_clients.add("client")
+    dashboard.socketio = mock.MagicMock()
+
+    class RacingQueue(queue.SimpleQueue):
+        raced = False
+
+        def get_nowait(self):
+            try:
+                return super().get_nowait()
+            except queue.Empty:
+                # another thread forces an update just after the queue ran dry
+                if not self.raced:
+                    self.raced = True
+                    dashboard.update_data(force=True, pump={"pump_state": "pumping"})
+                raise
+
+    dashboard._update_q = RacingQueue()
+    dashboard.update_data(force=True, faults={"hh_pressure": True})
+    dashboard._process_updates()
+    dashboard._process_updates()
+
+    first, second = (call.args[1] for call in dashboard.socketio.emit.call_args_list)
+    assert first["faults"]["hh_pressure"] is True
+    assert second["pump"] == {"pump_state": "pumping"}
+
+
+def test_index_renders_preloaded_template():
+    response = NAPDDashboard().app.test_client().get("/")
+
+    assert response.status_code == 200
+    assert b"/static/js/dashboard.js" in response.data
+
+
+def test_connect_sends_cached_snapshot_bytes():
+    dashboard = NAPDDashboard()
+    client = dashboard.socketio.test_client(dashboard.app)
+
+    received, selection = client.get_received()
+    assert received["name"] == "data_update"
+    assert received["args"][0] is dashboard.data.to_json_bytes()
+    assert selection["name"] == "pump_selection_changed"
+
+
+def test_background_loop_broadcasts_and_stops_promptly():
+    import threading
+    import time
+
+    dashboard = NAPDDashboard()
+    dashboard.connected_clients.add("client")
+    dashboard.socketio = mock.MagicMock()
+    dashboard.update_data(tank={"tank_level_mm": 900.0})
+
+    thread = threading.Thread(target=dashboard._background_updates)
+    dashboard._update_thread = thread
+    thread.start()
+    time.sleep(0.1)
+    started = time.monotonic()
+    dashboard.stop()
+
+    assert time.monotonic() - started < 0.5
+    assert not thread.is_alive()
+    events = [call.args[0] for call in dashboard.socketio.emit.call_args_list]
+    assert events == ["heartbeat", "data_delta"]
+
+
+def test_pump_selection_request_sends_encoded_payload():
+    import orjson
+
+    dashboard = NAPDDashboard()
+    DashboardInterface(dashboard).setSelectedPump(2)
+    client = dashboard.socketio.test_client(dashboard.app)
+    assert len(client.get_received()) == 2
+    client.emit("request_pump_selection")
+
+    (received,) = client.get_received()
+    payload = orjson.loads(received["args"][0])
+    assert received["name"] == "pump_selection_changed" and payload["selected_pump"] == 2
+    assert "timestamp" in payload
+
+
+def test_health_response_reused_between_probes():
+    client = NAPDDashboard().app.test_client()
+    first, second = client.get("/api/health"), client.get("/api/health")
+
+    assert first.get_json()["status"] == "healthy"
+    assert first.data == second.data
+
+
+def test_repeated_pump_state_not_rebroadcast():
+    dashboard = NAPDDashboard()
+    client = dashboard.socketio.test_client(dashboard.app)
+    client.emit("set_pump_state", {"state": "pumping"})
+    dashboard._process_updates()
+    client.get_received()
+
+    with mock.patch.object(dashboard, "broadcast_update") as broadcast:
+        client.emit("set_pump_state", {"state": "pumping"})
+        dashboard._process_updates()
+    broadcast.assert_not_called()
+    assert dashboard.data.pump_state == "pumping"
+
+
+def test_queued_updates_applied_as_one_merged_update():
+    dashboard = NAPDDashboard()
+    dashboard.update_data(pump={"target_rate": 10.0, "flow_rate": 2.0})
+    dashboard.update_data(pump={"target_rate": 20.0}, faults={"ll_tank_level": True})
+
+    apply_update = DashboardData.update_from_dict
+    with mock.patch.object(DashboardData, "update_from_dict", autospec=True, side_effect=apply_update) as apply:
+        dashboard._process_updates()
+    apply.assert_called_once()
+    assert (dashboard.data.target_rate, dashboard.data.flow_rate) == (20.0, 2.0)
+    assert dashboard.data.faults["ll_tank_level"] is True
+
+
+def test_interface_only_forces_changed_pump_states():
+    dashboard = NAPDDashboard()
+    interface = DashboardInterface(dashboard)
+    with mock.patch.object(dashboard, "update_data") as update:
+        interface.update_pump_data(pump_state="standby", flow_rate=1.0)
+        interface.update_pump2_data(pump_state="standby")
+    update.assert_called_once_with(force=False, pump={"flow_rate": 1.0})
+
+    interface.update_pump_data(pump_state="pumping")
+    assert dashboard._force_broadcast and dashboard._wake.is_set()
+
+
+def test_interface_corrects_pump_state_set_from_client():
+    dashboard = NAPDDashboard()
+    interface = DashboardInterface(dashboard)
+    dashboard.update_data(force=True, pump={"pump_state": "pumping"})
+    dashboard._process_updates()
+
+    # the app still reports its own state, which now differs from what the dashboard shows
+    interface.update_pump_data(pump_state="standby")
+    dashboard._process_updates()
+    assert dashboard.data.pump_state == "standby"